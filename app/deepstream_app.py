@@ -0,0 +1,376 @@
+"""
+Analog Gauge Meter Reading - DeepStream Pipeline
+==================================================
+GPU-resident pipeline for RTSP streams on Jetson / dGPU:
+
+  uridecodebin x N -> nvstreammux -> nvinfer (gauge pose) -> nvmultistreamtiler
+    -> nvvideoconvert -> nvdsosd -> nvvideoconvert -> nvv4l2h264enc
+    -> rtph264pay -> udpsink -> RTSP server (rtsp://<host>:<port>/gauge)
+
+Frames stay in NVMM (GPU) memory from decode to encode. nvinfer attaches
+the raw YOLOv8-Pose output tensor to each frame; a probe on its src pad
+decodes it with decode_pose_output, reuses GaugeReader.read_detections
+for the angle/value mapping, and attaches OSD display meta for drawing.
+
+Requires the DeepStream SDK Python bindings (pyds) and GStreamer
+introspection (gi). Run via:
+  python -m gauge_meter_analog_reading_realtime.app.main --mode deepstream
+"""
+
+import os
+import math
+import ctypes
+import logging
+import platform
+import configparser
+
+import numpy as np
+import gi
+
+gi.require_version("Gst", "1.0")
+gi.require_version("GstRtspServer", "1.0")
+from gi.repository import GLib, Gst, GstRtspServer
+import pyds
+
+from gauge_meter_analog_reading_realtime.internal.ai_runtime.gauge_read import (
+    GaugeReader,
+    decode_pose_output,
+)
+
+logger = logging.getLogger("GaugeMeterApp.DeepStream")
+
+DEFAULT_PGIE_CONFIG = "gauge_meter_analog_reading_realtime/config/deepstream_pgie.txt"
+
+
+class GaugeProbe:
+    """
+    Buffer probe on the nvinfer src pad.
+
+    For every frame in the batch: read the raw output tensor, decode and
+    NMS it, undo the nvinfer letterbox (maintain-aspect-ratio with
+    symmetric-padding) to get muxer resolution coordinates, compute the
+    readings, and attach display meta for nvdsosd.
+    """
+
+    def __init__(self, reader: GaugeReader, net_size: tuple, mux_size: tuple,
+                 display_cfg: dict):
+        self.reader = reader
+        # nvinfer scales the muxer frame by one factor and pads it evenly
+        self.scale = min(net_size[0] / mux_size[0], net_size[1] / mux_size[1])
+        pad_x = (net_size[0] - mux_size[0] * self.scale) / 2
+        pad_y = (net_size[1] - mux_size[1] * self.scale) / 2
+        self.pad_box = np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)
+        self.pad_xy = np.array([pad_x, pad_y], dtype=np.float32)
+        self.show_keypoints = display_cfg.get("show_keypoints", True)
+        self.show_angle = display_cfg.get("show_angle", True)
+        self.show_bbox = display_cfg.get("show_bbox", True)
+
+    def __call__(self, pad, info, u_data):
+        gst_buffer = info.get_buffer()
+        if not gst_buffer:
+            return Gst.PadProbeReturn.OK
+
+        batch_meta = pyds.gst_buffer_get_nvds_batch_meta(hash(gst_buffer))
+        l_frame = batch_meta.frame_meta_list
+        while l_frame is not None:
+            try:
+                frame_meta = pyds.NvDsFrameMeta.cast(l_frame.data)
+            except StopIteration:
+                break
+
+            output = self._output_tensor(frame_meta)
+            if output is not None:
+                detections = decode_pose_output(output, self.reader.confidence)
+                # Undo the letterbox padding, then the resize
+                detections.bboxes -= self.pad_box
+                detections.kps_xy -= self.pad_xy
+                detections = detections.scaled(1 / self.scale, 1 / self.scale)
+                readings = self.reader.read_detections(detections)
+                for reading in readings:
+                    self._draw_reading(batch_meta, frame_meta, reading)
+
+                # Log readings periodically
+                if frame_meta.frame_num % 30 == 0:
+                    for reading in readings:
+                        logger.info(
+                            f"[DEEPSTREAM #{frame_meta.pad_index}] Reading: "
+                            f"{reading['value']:.2f} {reading['unit']} "
+                            f"(angle={reading['angle']:.1f}°)"
+                        )
+
+            try:
+                l_frame = l_frame.next
+            except StopIteration:
+                break
+
+        return Gst.PadProbeReturn.OK
+
+    @staticmethod
+    def _output_tensor(frame_meta) -> np.ndarray | None:
+        """Return the frame's raw (channels, anchors) output tensor, if attached."""
+        l_user = frame_meta.frame_user_meta_list
+        while l_user is not None:
+            try:
+                user_meta = pyds.NvDsUserMeta.cast(l_user.data)
+            except StopIteration:
+                break
+
+            if user_meta.base_meta.meta_type == pyds.NvDsMetaType.NVDSINFER_TENSOR_OUTPUT_META:
+                tensor_meta = pyds.NvDsInferTensorMeta.cast(user_meta.user_meta_data)
+                layer = pyds.get_nvds_LayerInfo(tensor_meta, 0)
+                dims = layer.inferDims
+                ptr = ctypes.cast(pyds.get_ptr(layer.buffer), ctypes.POINTER(ctypes.c_float))
+                # View into the nvinfer host buffer, valid for the duration of the probe
+                return np.ctypeslib.as_array(ptr, shape=(dims.d[0], dims.d[1]))
+
+            try:
+                l_user = l_user.next
+            except StopIteration:
+                break
+
+        return None
+
+    def _draw_reading(self, batch_meta, frame_meta, reading: dict):
+        """Attach nvdsosd display meta mirroring GaugeReader.draw_result."""
+        display_meta = pyds.nvds_acquire_display_meta_from_pool(batch_meta)
+
+        x1, y1, x2, y2 = (max(0, int(v)) for v in reading["bbox"])
+        center = tuple(max(0, int(v)) for v in reading["center"])
+        needle_tip = tuple(max(0, int(v)) for v in reading["needle_tip"])
+
+        # Draw bounding box
+        if self.show_bbox:
+            rect = display_meta.rect_params[display_meta.num_rects]
+            display_meta.num_rects += 1
+            rect.left, rect.top = x1, y1
+            rect.width, rect.height = x2 - x1, y2 - y1
+            rect.border_width = 2
+            rect.border_color.set(0.0, 1.0, 0.0, 1.0)
+            rect.has_bg_color = 0
+
+        # Draw keypoints and needle line
+        if self.show_keypoints:
+            line = display_meta.line_params[display_meta.num_lines]
+            display_meta.num_lines += 1
+            line.x1, line.y1 = center
+            line.x2, line.y2 = needle_tip
+            line.line_width = 2
+            line.line_color.set(0.0, 1.0, 1.0, 1.0)
+
+            for (xc, yc), color in ((center, (0.0, 0.0, 1.0, 1.0)), (needle_tip, (1.0, 0.0, 0.0, 1.0))):
+                circle = display_meta.circle_params[display_meta.num_circles]
+                display_meta.num_circles += 1
+                circle.xc, circle.yc = xc, yc
+                circle.radius = 6
+                circle.circle_color.set(1.0, 1.0, 1.0, 1.0)
+                circle.has_bg_color = 1
+                circle.bg_color.set(*color)
+
+        # Main value text with background
+        text = display_meta.text_params[display_meta.num_labels]
+        display_meta.num_labels += 1
+        text.display_text = f"{reading['value']:.3f} {reading['unit']}"
+        text.x_offset, text.y_offset = x1, max(0, y1 - 40)
+        text.font_params.font_name = "Serif"
+        text.font_params.font_size = 14
+        text.font_params.font_color.set(1.0, 1.0, 0.0, 1.0)
+        text.set_bg_clr = 1
+        text.text_bg_clr.set(0.0, 0.0, 0.0, 1.0)
+
+        # Angle and confidence info
+        if self.show_angle:
+            info = display_meta.text_params[display_meta.num_labels]
+            display_meta.num_labels += 1
+            info.display_text = f"Angle: {reading['angle']:.1f} | Conf: {reading['confidence']:.2f}"
+            info.x_offset, info.y_offset = x1, y2 + 10
+            info.font_params.font_name = "Serif"
+            info.font_params.font_size = 10
+            info.font_params.font_color.set(0.8, 0.8, 0.8, 1.0)
+            info.set_bg_clr = 0
+
+        pyds.nvds_add_display_meta_to_frame(frame_meta, display_meta)
+
+
+def _make_element(factory: str, name: str) -> Gst.Element:
+    """Create a GStreamer element or raise if the plugin is missing."""
+    element = Gst.ElementFactory.make(factory, name)
+    if element is None:
+        raise RuntimeError(f"Unable to create GStreamer element '{factory}' ({name})")
+    return element
+
+
+def _on_pad_added(decodebin, pad, sinkpad):
+    """Link a decoded NVMM video pad from uridecodebin to nvstreammux."""
+    caps = pad.get_current_caps() or pad.query_caps(None)
+    if not caps.get_structure(0).get_name().startswith("video"):
+        return
+    if not caps.get_features(0).contains("memory:NVMM"):
+        logger.error("Decoder output is not in NVMM memory; an NVIDIA decoder is required.")
+        return
+    if pad.link(sinkpad) != Gst.PadLinkReturn.OK:
+        logger.error("Failed to link decoder to nvstreammux.")
+
+
+def _prepare_pgie_config(pgie_config: str, model_path: str, batch: int) -> tuple:
+    """
+    Make sure the ONNX model referenced by the nvinfer config exists and
+    work out the serialized engine nvinfer builds for `batch` streams.
+
+    Returns:
+        (net_w, net_h, engine_path): network input size from infer-dims,
+        and the engine file name nvinfer uses for this batch size
+        ("<onnx-file>_b<batch>_gpu<id>_<precision>.engine"), or None when
+        the config has no onnx-file
+    """
+    parser = configparser.ConfigParser()
+    parser.read(pgie_config)
+    props = parser["property"]
+
+    _, net_h, net_w = (int(v) for v in props.get("infer-dims", "3;640;640").split(";"))
+
+    engine_path = None
+    onnx_file = props.get("onnx-file")
+    if onnx_file:
+        onnx_path = os.path.join(os.path.dirname(os.path.abspath(pgie_config)), onnx_file)
+        if not os.path.exists(onnx_path):
+            # Dynamic batch, so the export does not depend on the number of streams
+            GaugeReader.export_onnx(model_path, imgsz=net_w, dynamic=True, output_path=onnx_path)
+
+        precision = {"0": "fp32", "1": "int8", "2": "fp16"}[props.get("network-mode", "0")]
+        engine_path = f"{onnx_path}_b{batch}_gpu{props.get('gpu-id', '0')}_{precision}.engine"
+
+    return net_w, net_h, engine_path
+
+
+def run_deepstream_mode(reader: GaugeReader, sources: list, config: dict):
+    """
+    Real-time gauge reading from RTSP streams/files with a DeepStream pipeline,
+    re-streamed as annotated H.264 over RTSP.
+
+    Args:
+        reader: GaugeReader instance (used for the angle/value mapping)
+        sources: List of RTSP URLs or video file paths
+        config: Full configuration dict
+    """
+    Gst.init(None)
+
+    ds_cfg = config.get("deepstream", {})
+    display_cfg = config.get("display", {})
+    pgie_config = ds_cfg.get("pgie_config", DEFAULT_PGIE_CONFIG)
+    mux_w = ds_cfg.get("muxer_width", 1920)
+    mux_h = ds_cfg.get("muxer_height", 1080)
+    rtsp_port = ds_cfg.get("rtsp_port", 8554)
+    udp_port = ds_cfg.get("udp_port", 5400)
+    num_sources = len(sources)
+
+    net_w, net_h, engine_path = _prepare_pgie_config(
+        pgie_config, config.get("model", {}).get("path"), num_sources
+    )
+
+    pipeline = Gst.Pipeline()
+
+    streammux = _make_element("nvstreammux", "stream-muxer")
+    streammux.set_property("batch-size", num_sources)
+    streammux.set_property("width", mux_w)
+    streammux.set_property("height", mux_h)
+    streammux.set_property("batched-push-timeout", 40000)
+    streammux.set_property("live-source", 1)
+    pipeline.add(streammux)
+
+    for i, source in enumerate(sources):
+        uri = source if "://" in source else Gst.filename_to_uri(os.path.abspath(source))
+        logger.info(f"DEEPSTREAM mode — adding source #{i}: {uri}")
+
+        decodebin = _make_element("uridecodebin", f"source-{i}")
+        decodebin.set_property("uri", uri)
+        pipeline.add(decodebin)
+
+        sinkpad = (streammux.request_pad_simple(f"sink_{i}")
+                   if hasattr(streammux, "request_pad_simple")
+                   else streammux.get_request_pad(f"sink_{i}"))
+        decodebin.connect("pad-added", _on_pad_added, sinkpad)
+
+    pgie = _make_element("nvinfer", "primary-inference")
+    pgie.set_property("config-file-path", os.path.abspath(pgie_config))
+    pgie.set_property("batch-size", num_sources)
+    if engine_path:
+        # The engine in the config file is for batch 1; point nvinfer at the
+        # one matching the runtime batch so it is built once and then reused
+        pgie.set_property("model-engine-file", engine_path)
+
+    tiler = _make_element("nvmultistreamtiler", "tiler")
+    rows = int(math.sqrt(num_sources))
+    tiler.set_property("rows", rows)
+    tiler.set_property("columns", int(math.ceil(num_sources / rows)))
+    tiler.set_property("width", mux_w)
+    tiler.set_property("height", mux_h)
+
+    convert_osd = _make_element("nvvideoconvert", "convert-osd")
+    osd = _make_element("nvdsosd", "onscreendisplay")
+    convert_enc = _make_element("nvvideoconvert", "convert-encoder")
+
+    capsfilter = _make_element("capsfilter", "encoder-caps")
+    capsfilter.set_property("caps", Gst.Caps.from_string("video/x-raw(memory:NVMM), format=I420"))
+
+    encoder = _make_element("nvv4l2h264enc", "encoder")
+    encoder.set_property("bitrate", ds_cfg.get("bitrate", 4000000))
+    if platform.machine() == "aarch64":
+        encoder.set_property("insert-sps-pps", 1)
+
+    rtppay = _make_element("rtph264pay", "rtppay")
+    udpsink = _make_element("udpsink", "udpsink")
+    udpsink.set_property("host", "224.224.255.255")
+    udpsink.set_property("port", udp_port)
+    udpsink.set_property("async", False)
+    udpsink.set_property("sync", 1)
+
+    chain = [pgie, tiler, convert_osd, osd, convert_enc, capsfilter, encoder, rtppay, udpsink]
+    for element in chain:
+        pipeline.add(element)
+    streammux.link(chain[0])
+    for upstream, downstream in zip(chain, chain[1:]):
+        if not upstream.link(downstream):
+            raise RuntimeError(f"Failed to link {upstream.get_name()} -> {downstream.get_name()}")
+
+    # Decode keypoints and compute readings right after inference
+    probe = GaugeProbe(reader, (net_w, net_h), (mux_w, mux_h), display_cfg)
+    pgie.get_static_pad("src").add_probe(Gst.PadProbeType.BUFFER, probe, 0)
+
+    # Serve the encoded RTP stream over RTSP
+    server = GstRtspServer.RTSPServer.new()
+    server.props.service = str(rtsp_port)
+    server.attach(None)
+    factory = GstRtspServer.RTSPMediaFactory.new()
+    factory.set_launch(
+        f'( udpsrc name=pay0 port={udp_port} buffer-size=524288 '
+        f'caps="application/x-rtp, media=video, clock-rate=90000, '
+        f'encoding-name=(string)H264, payload=96" )'
+    )
+    factory.set_shared(True)
+    server.get_mount_points().add_factory("/gauge", factory)
+    logger.info(f"Annotated stream available at rtsp://localhost:{rtsp_port}/gauge")
+
+    loop = GLib.MainLoop()
+
+    def on_message(bus, message):
+        if message.type == Gst.MessageType.EOS:
+            logger.info("End of stream.")
+            loop.quit()
+        elif message.type == Gst.MessageType.ERROR:
+            err, debug = message.parse_error()
+            logger.error(f"Pipeline error: {err} ({debug})")
+            loop.quit()
+        return True
+
+    bus = pipeline.get_bus()
+    bus.add_signal_watch()
+    bus.connect("message", on_message)
+
+    pipeline.set_state(Gst.State.PLAYING)
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        logger.info("Interrupted by user.")
+    finally:
+        pipeline.set_state(Gst.State.NULL)
+        logger.info("DEEPSTREAM mode finished.")
@@ -1,10 +1,12 @@
 """
 Analog Gauge Meter Reading - Main Application
 ===============================================
-Supports three input modes:
-  1. Image  — read a single image and display result
-  2. Webcam — real-time gauge reading from webcam
-  3. RTSP   — real-time gauge reading from RTSP stream
+Supports four input modes:
+  1. Image      — read a single image and display result
+  2. Webcam     — real-time gauge reading from webcam
+  3. RTSP       — real-time gauge reading from RTSP stream
+  4. DeepStream — GPU pipeline for RTSP streams with RTSP output
+                  (see app/deepstream_app.py)
 
 Usage:
   cd /home/ozzaann/gauge_model
@@ -14,10 +16,14 @@ Usage:
 
 import sys
 import os
+import copy
+import functools
 import cv2
 import yaml
 import logging
 import argparse
+import queue
+import threading
 import time
 
 # Ensure the project root is importable
@@ -25,7 +31,10 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from gauge_meter_analog_reading_realtime.internal.ai_runtime.gauge_read import GaugeReader
+from gauge_meter_analog_reading_realtime.internal.ai_runtime.gauge_read import (
+    GaugeReader,
+    TextPatchCache,
+)
 
 # --- Logging Setup ---
 logging.basicConfig(
@@ -36,10 +45,21 @@ logging.basicConfig(
 logger = logging.getLogger("GaugeMeterApp")
 
 
+# Use the libyaml C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(path: str, mtime: float) -> dict:
+    """Parse a YAML file once per (path, mtime); edits to the file invalidate the entry."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_config(config_path: str) -> dict:
-    """Load YAML configuration file."""
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    """Load YAML configuration file (cached until the file is modified)."""
+    path = os.path.abspath(config_path)
+    config = copy.deepcopy(_load_yaml_cached(path, os.path.getmtime(path)))
     logger.info(f"Configuration loaded from: {config_path}")
     return config
 
@@ -73,12 +93,13 @@ def run_image_mode(reader: GaugeReader, image_path: str, config: dict):
         show_bbox=display_cfg.get("show_bbox", True),
     )
 
-    # Resize for display
+    # Let the window scale the full-resolution frame on display
     win_w = display_cfg.get("window_width", 800)
     win_h = display_cfg.get("window_height", 600)
-    display_frame = cv2.resize(annotated, (win_w, win_h))
+    cv2.namedWindow("Analog Gauge Reader", cv2.WINDOW_NORMAL)
+    cv2.resizeWindow("Analog Gauge Reader", win_w, win_h)
 
-    cv2.imshow("Analog Gauge Reader", display_frame)
+    cv2.imshow("Analog Gauge Reader", annotated)
     logger.info("Press any key to exit...")
     cv2.waitKey(0)
     cv2.destroyAllWindows()
@@ -91,72 +112,191 @@ def run_image_mode(reader: GaugeReader, image_path: str, config: dict):
     logger.info(f"Result saved to: {output_path}")
 
 
-def run_realtime_mode(reader: GaugeReader, source, config: dict, mode_name: str):
+def _grabber(cap: cv2.VideoCapture, frame_queue: queue.Queue, skip: int,
+             stop_event: threading.Event, frame_ready: threading.Event,
+             source_name: str):
     """
-    Real-time gauge reading from webcam or RTSP stream.
+    Capture thread: grab every frame to keep the stream position current,
+    decode every `skip`-th one and publish it to a 1-slot queue.
+
+    The queue always holds the latest decoded frame; an unconsumed older
+    frame is dropped so the consumer never processes stale frames.
+    `frame_ready` is shared by all grabbers and set after every publish,
+    so the consumer can wait for whichever source delivers first.
+    """
+    tick = 0
+    while not stop_event.is_set():
+        if not cap.grab():
+            logger.warning(f"Failed to read frame from {source_name}.")
+            time.sleep(0.1)
+            continue
+
+        tick += 1
+        if tick % skip != 0:
+            continue
+
+        ret, frame = cap.retrieve()
+        if not ret:
+            continue
+
+        try:
+            frame_queue.put(frame, block=False)
+        except queue.Full:
+            # Drop the oldest frame and publish the newest one
+            try:
+                frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                frame_queue.put(frame, block=False)
+            except queue.Full:
+                pass
+        frame_ready.set()
+
+
+def run_realtime_mode(reader: GaugeReader, sources: list, config: dict, mode_name: str):
+    """
+    Real-time gauge reading from one or more webcams or RTSP streams.
+
+    Each source is captured in its own grabber thread into a 1-slot
+    queue, so decoding overlaps with inference. The main thread waits for
+    the first new frame, takes the latest frame from every source that has
+    one and sends them through the model in a single batched forward pass,
+    so a stalled source does not hold back the others. When
+    source.target_fps is set, frames are still grabbed at the source rate
+    (to keep the stream position current) but only every Nth frame is
+    decoded, where N = source_fps / target_fps.
+
+    Display (cv2.imshow / cv2.waitKey) stays in the main thread because
+    OpenCV HighGUI is not thread-safe.
 
     Args:
         reader: GaugeReader instance
-        source: Webcam ID (int) or RTSP URL (str)
+        sources: List of webcam IDs (int) or RTSP URLs (str)
         config: Full configuration dict
         mode_name: "webcam" or "rtsp" for logging
     """
-    logger.info(f"{mode_name.upper()} mode — connecting to source: {source}")
+    caps = []
+    for source in sources:
+        logger.info(f"{mode_name.upper()} mode — connecting to source: {source}")
+        cap = cv2.VideoCapture(source)
+        if not cap.isOpened():
+            logger.error(f"Failed to open {mode_name} source: {source}")
+            for opened in caps:
+                opened.release()
+            return
+        # Keep only the latest frame to avoid multi-second RTSP buffering
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        caps.append(cap)
 
-    cap = cv2.VideoCapture(source)
-    if not cap.isOpened():
-        logger.error(f"Failed to open {mode_name} source: {source}")
-        return
+    logger.info(f"Connected to {len(caps)} {mode_name} source(s). Press 'q' to quit.")
 
-    logger.info(f"Connected to {mode_name}. Press 'q' to quit.")
+    target_fps = config.get("source", {}).get("target_fps", 0)
+    skips = []
+    for i, cap in enumerate(caps):
+        src_fps = cap.get(cv2.CAP_PROP_FPS)
+        skip = max(1, int(round(src_fps / target_fps))) if target_fps and src_fps > 0 else 1
+        skips.append(skip)
+        logger.info(f"Source #{i}: {src_fps:.1f} FPS, decoding every {skip} frame(s)")
 
     display_cfg = config.get("display", {})
     win_w = display_cfg.get("window_width", 800)
     win_h = display_cfg.get("window_height", 600)
 
+    window_names = [
+        "Analog Gauge Reader - Realtime" if len(caps) == 1
+        else f"Analog Gauge Reader - Realtime [{i}]"
+        for i in range(len(caps))
+    ]
+    # Resizable windows: the GUI backend scales frames on display, so no
+    # per-frame cv2.resize is needed
+    for name in window_names:
+        cv2.namedWindow(name, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(name, win_w, win_h)
+
+    stop_event = threading.Event()
+    frame_ready = threading.Event()
+    queues = [queue.Queue(maxsize=1) for _ in caps]
+    threads = [
+        threading.Thread(
+            target=_grabber,
+            args=(cap, q, skip, stop_event, frame_ready, f"{mode_name} source #{i}"),
+            daemon=True,
+        )
+        for i, (cap, q, skip) in enumerate(zip(caps, queues, skips))
+    ]
+    for thread in threads:
+        thread.start()
+
+    mode_upper = mode_name.upper()
     fps_start_time = time.time()
     frame_count = 0
+    fps_text = None
+    # FPS glyphs are rasterized once per distinct text and blitted afterwards
+    fps_overlay = TextPatchCache(0.8, (0, 255, 0), 2)
 
     try:
         while True:
-            ret, frame = cap.read()
-            if not ret:
-                logger.warning(f"Failed to read frame from {mode_name}.")
-                time.sleep(0.1)
+            # Wait for the first source to deliver, then batch whatever
+            # every source has ready; a stalled source never blocks the others.
+            # Cleared before collecting so a frame published meanwhile
+            # wakes up the next iteration.
+            frame_ready.wait(timeout=1.0)
+            frame_ready.clear()
+            frames = []
+            frame_ids = []
+            for i, q in enumerate(queues):
+                try:
+                    frames.append(q.get_nowait())
+                    frame_ids.append(i)
+                except queue.Empty:
+                    continue
+
+            if not frames:
+                # Keep the windows responsive while waiting for frames
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    logger.info("User pressed 'q'. Exiting...")
+                    break
                 continue
 
-            # Run gauge reading
-            readings = reader.read_gauge(frame)
-
-            # Draw results
-            annotated = reader.draw_result(
-                frame, readings,
-                show_keypoints=display_cfg.get("show_keypoints", True),
-                show_angle=display_cfg.get("show_angle", True),
-                show_bbox=display_cfg.get("show_bbox", True),
-            )
+            # Run gauge reading on all frames in one batch
+            batch_readings = reader.read_gauge_batch(frames)
 
-            # Calculate FPS
+            # Calculate FPS (overlay text refreshed every 15 frames)
             frame_count += 1
-            elapsed = time.time() - fps_start_time
-            if elapsed > 0:
-                fps = frame_count / elapsed
-                cv2.putText(
-                    annotated, f"FPS: {fps:.1f}",
-                    (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2
+            if fps_text is None or frame_count % 15 == 0:
+                elapsed = time.time() - fps_start_time
+                if elapsed > 0:
+                    fps_text = f"FPS: {frame_count / elapsed:.1f}"
+
+            # Build log records only when they will actually be emitted
+            log_due = frame_count % 30 == 0 and logger.isEnabledFor(logging.INFO)
+
+            for i, frame, readings in zip(frame_ids, frames, batch_readings):
+                # Draw results directly on the captured frame; it is
+                # discarded after display so no copy is needed
+                annotated = reader.draw_result(
+                    frame, readings,
+                    show_keypoints=display_cfg.get("show_keypoints", True),
+                    show_angle=display_cfg.get("show_angle", True),
+                    show_bbox=display_cfg.get("show_bbox", True),
+                    inplace=True,
                 )
 
-            # Log readings periodically
-            if frame_count % 30 == 0 and readings:
-                for reading in readings:
+                if fps_text is not None:
+                    fps_overlay.draw(annotated, fps_text, (10, 30))
+
+                # Log readings periodically, one record per source
+                if log_due and readings:
                     logger.info(
-                        f"[{mode_name.upper()}] Reading: {reading['value']:.2f} {reading['unit']} "
-                        f"(angle={reading['angle']:.1f}°)"
+                        "[%s #%d] Reading: %s", mode_upper, i,
+                        ", ".join(
+                            "%.2f %s (angle=%.1f°)" % (r["value"], r["unit"], r["angle"])
+                            for r in readings
+                        ),
                     )
 
-            # Resize and display
-            display_frame = cv2.resize(annotated, (win_w, win_h))
-            cv2.imshow("Analog Gauge Reader - Realtime", display_frame)
+                cv2.imshow(window_names[i], annotated)
 
             key = cv2.waitKey(1) & 0xFF
             if key == ord("q"):
@@ -166,7 +306,15 @@ def run_realtime_mode(reader: GaugeReader, source, config: dict, mode_name: str)
     except KeyboardInterrupt:
         logger.info("Interrupted by user.")
     finally:
-        cap.release()
+        stop_event.set()
+        for thread in threads:
+            thread.join(timeout=1.0)
+        for i, (cap, thread) in enumerate(zip(caps, threads)):
+            # A grabber stuck in a blocking grab() still uses its capture
+            if thread.is_alive():
+                logger.warning(f"{mode_name} source #{i} grabber did not stop, not releasing it.")
+                continue
+            cap.release()
         cv2.destroyAllWindows()
         logger.info(f"{mode_name.upper()} mode finished.")
 
@@ -185,7 +333,7 @@ def main():
     parser.add_argument(
         "--mode",
         type=str,
-        choices=["image", "webcam", "rtsp"],
+        choices=["image", "webcam", "rtsp", "deepstream"],
         default=None,
         help="Input mode (overrides config)",
     )
@@ -200,37 +348,66 @@ def main():
     # Load config
     config = load_config(args.config)
 
-    # Initialize GaugeReader
+    # Determine mode
+    source_cfg = config.get("source", {})
+    mode = args.mode or source_cfg.get("type", "image")
+
+    # Resolve the sources first: the engine batch depends on their number
+    if mode == "image":
+        sources = [args.image or source_cfg.get("path", "test_image.png")]
+    elif mode == "webcam":
+        sources = source_cfg.get("webcam_id", 0)
+        if not isinstance(sources, list):
+            sources = [sources]
+    elif mode in ("rtsp", "deepstream"):
+        sources = source_cfg.get("rtsp_url", "")
+        if not isinstance(sources, list):
+            sources = [sources] if sources else []
+        if not sources:
+            logger.error("RTSP URL is not configured. Set 'source.rtsp_url' in config.")
+            return
+    else:
+        logger.error(f"Unknown mode: {mode}")
+        return
+
+    # Initialize GaugeReader. DeepStream runs inference in nvinfer and only
+    # needs the angle/value mapping, so no model is loaded for it
     model_cfg = config.get("model", {})
     gauge_cfg = config.get("gauge", {})
 
+    # All streams go through the model in one batch; a TensorRT engine
+    # rejects batches larger than the one it was built for
+    engine_batch = model_cfg.get("engine_batch", 1)
+    if len(sources) > engine_batch:
+        if model_cfg.get("engine") and mode != "deepstream":
+            logger.info(
+                f"model.engine_batch={engine_batch} is smaller than the number of "
+                f"sources ({len(sources)}), building the engine for batch {len(sources)}"
+            )
+        engine_batch = len(sources)
+
     reader = GaugeReader(
         model_path=model_cfg.get("path", "gauge_meter_analog_reading_realtime/models/gauge-pose.pt"),
         gauge_config=gauge_cfg,
         confidence=model_cfg.get("confidence", 0.5),
+        engine=model_cfg.get("engine") or None,
+        calib_data=model_cfg.get("calib_data") or None,
+        engine_batch=engine_batch,
+        imgsz=model_cfg.get("imgsz", 640),
+        backend="none" if mode == "deepstream" else model_cfg.get("backend", "auto"),
     )
 
-    # Determine mode
-    source_cfg = config.get("source", {})
-    mode = args.mode or source_cfg.get("type", "image")
-
     if mode == "image":
-        image_path = args.image or source_cfg.get("path", "test_image.png")
-        run_image_mode(reader, image_path, config)
-
-    elif mode == "webcam":
-        webcam_id = source_cfg.get("webcam_id", 0)
-        run_realtime_mode(reader, webcam_id, config, "webcam")
+        run_image_mode(reader, sources[0], config)
 
-    elif mode == "rtsp":
-        rtsp_url = source_cfg.get("rtsp_url", "")
-        if not rtsp_url:
-            logger.error("RTSP URL is not configured. Set 'source.rtsp_url' in config.")
-            return
-        run_realtime_mode(reader, rtsp_url, config, "rtsp")
+    elif mode in ("webcam", "rtsp"):
+        run_realtime_mode(reader, sources, config, mode)
 
     else:
-        logger.error(f"Unknown mode: {mode}")
+        # Imported lazily: requires the DeepStream SDK (pyds) and GStreamer bindings
+        from gauge_meter_analog_reading_realtime.app.deepstream_app import run_deepstream_mode
+
+        run_deepstream_mode(reader, sources, config)
 
 
 if __name__ == "__main__":
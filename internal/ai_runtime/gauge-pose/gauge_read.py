@@ -11,15 +11,285 @@ The angle between center and needle tip is computed and mapped
 to a physical value based on configurable min/max angle and value.
 """
 
+import os
 import cv2
 import numpy as np
 import math
 import logging
-from ultralytics import YOLO
+import functools
+from dataclasses import dataclass
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _compute_angle(cx: float, cy: float, tx: float, ty: float) -> float:
+    """Compiled kernel for GaugeReader.compute_angle."""
+    dx = tx - cx
+    dy = -(ty - cy)  # Negate because y is inverted in image coords
+    return math.degrees(math.atan2(dy, dx))
+
+
+@njit(cache=True, fastmath=True)
+def _angle_to_value(angle: float, min_a_norm: float, inv_sweep: float,
+                    min_v: float, value_span: float) -> float:
+    """Compiled kernel for GaugeReader.angle_to_value (precomputed calibration)."""
+    # Clockwise distance from min_a to needle, as a fraction of the sweep
+    fraction = ((min_a_norm - angle % 360) % 360) * inv_sweep
+    fraction = max(0.0, min(1.0, fraction))
+
+    # Linear interpolation
+    return min_v + fraction * value_span
+
+
+@njit(fastmath=True, cache=True)
+def _process_detections(kps_xy: np.ndarray, kps_conf: np.ndarray, kp_conf_threshold: float,
+                        min_a_norm: float, inv_sweep: float,
+                        min_v: float, value_span: float) -> tuple:
+    """
+    Compiled per-frame kernel: keypoint confidence check, needle angle and
+    value for each detection. Runs serially: a frame holds only a few
+    gauges, too few for thread dispatch (parallel=True) to pay off.
+
+    Args:
+        kps_xy: (N, K, 2) keypoint coordinates (0 = center, 1 = needle tip)
+        kps_conf: (N, K) keypoint confidences
+        kp_conf_threshold: Minimum confidence for both keypoints
+        min_a_norm, inv_sweep, min_v, value_span: Precomputed calibration
+
+    Returns:
+        (values, angles, keep_mask), each of shape (N,)
+    """
+    n = kps_xy.shape[0]
+    values = np.empty(n, dtype=np.float64)
+    angles = np.empty(n, dtype=np.float64)
+    keep = np.empty(n, dtype=np.bool_)
+
+    for i in range(n):
+        keep[i] = kps_conf[i, 0] >= kp_conf_threshold and kps_conf[i, 1] >= kp_conf_threshold
+        angle = _compute_angle(kps_xy[i, 0, 0], kps_xy[i, 0, 1], kps_xy[i, 1, 0], kps_xy[i, 1, 1])
+        angles[i] = angle
+        values[i] = _angle_to_value(angle, min_a_norm, inv_sweep, min_v, value_span)
+
+    return values, angles, keep
+
+
+@functools.lru_cache(maxsize=None)
+def _gauge_pose_predictor_cls() -> type:
+    """
+    Return the GaugePosePredictor class, defined on first use so torch and
+    Ultralytics are only imported by the "ultralytics" backend.
+    """
+    import torch
+    from ultralytics.models.yolo.pose import PosePredictor
+
+    class GaugePosePredictor(PosePredictor):
+        """
+        PosePredictor with a lighter preprocess for numpy frame input.
+
+        CPU: the default preprocess runs BGR->RGB, HWC->CHW, uint8->float and
+        /255 as separate tensor ops. Here a single cv2.dnn.blobFromImages call
+        does all of them in one SIMD pass and the blob is used zero-copy.
+
+        CUDA: the default preprocess stacks the letterboxed uint8 frames into a
+        new pageable tensor and copies it synchronously on every call. Here the
+        frames are written into a page-locked (B, H, W, 3) uint8 buffer that is
+        kept across calls, and the host-to-device copy is issued with
+        non_blocking=True into a matching device buffer. Channel reorder and
+        float conversion stay on the GPU, so only uint8 crosses PCIe.
+        """
+
+        _pinned_host: torch.Tensor | None = None
+        _device_buf: torch.Tensor | None = None
+
+        def preprocess(self, im):
+            if isinstance(im, torch.Tensor):
+                return super().preprocess(im)
+
+            im = self.pre_transform(im)
+
+            if self.device.type != "cuda":
+                # BGR->RGB, HWC->CHW, uint8->float32, /255 and batch dim in one pass
+                blob = cv2.dnn.blobFromImages(im, scalefactor=1.0 / 255, swapRB=True)
+                x = torch.from_numpy(blob).to(self.device)
+                return x.half() if self.model.fp16 else x
+
+            shape = (len(im), *im[0].shape)
+            if self._pinned_host is None or tuple(self._pinned_host.shape) != shape:
+                self._pinned_host = torch.empty(shape, dtype=torch.uint8, pin_memory=True)
+                self._device_buf = torch.empty(shape, dtype=torch.uint8, device=self.device)
+
+            host = self._pinned_host.numpy()
+            for i, img in enumerate(im):
+                host[i] = img
+            self._device_buf.copy_(self._pinned_host, non_blocking=True)
+
+            x = self._device_buf.permute(0, 3, 1, 2).flip(1).contiguous()  # BHWC BGR -> BCHW RGB
+            return (x.half() if self.model.fp16 else x.float()).div_(255)
+
+    return GaugePosePredictor
+
+
+@dataclass
+class Detections:
+    """
+    Detections of a single frame in structure-of-arrays layout.
+
+    Attributes:
+        bboxes: (N, 4) float32 array of [x1, y1, x2, y2]
+        kps_xy: (N, K, 2) float32 array of keypoint (x, y)
+        kps_conf: (N, K) float32 array of keypoint confidences
+        det_conf: (N,) float32 array of detection confidences
+    """
+
+    bboxes: np.ndarray
+    kps_xy: np.ndarray
+    kps_conf: np.ndarray
+    det_conf: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.det_conf)
+
+    @classmethod
+    def empty(cls, num_keypoints: int = 2) -> "Detections":
+        """Create a Detections object with no rows."""
+        return cls(
+            bboxes=np.zeros((0, 4), dtype=np.float32),
+            kps_xy=np.zeros((0, num_keypoints, 2), dtype=np.float32),
+            kps_conf=np.zeros((0, num_keypoints), dtype=np.float32),
+            det_conf=np.zeros((0,), dtype=np.float32),
+        )
+
+    def scaled(self, sx: float, sy: float) -> "Detections":
+        """Return a copy with x coordinates multiplied by sx and y by sy."""
+        return Detections(
+            bboxes=self.bboxes * np.array([sx, sy, sx, sy], dtype=np.float32),
+            kps_xy=self.kps_xy * np.array([sx, sy], dtype=np.float32),
+            kps_conf=self.kps_conf,
+            det_conf=self.det_conf,
+        )
+
+
+def decode_pose_output(output: np.ndarray, conf_threshold: float,
+                       iou_threshold: float = 0.7, num_keypoints: int = 2) -> Detections:
+    """
+    Decode a raw YOLOv8-Pose output tensor (ONNX / TensorRT / DeepStream)
+    into Detections, including confidence filtering and NMS.
+
+    The tensor layout is (4 + num_classes + num_keypoints * 3, num_anchors):
+    box center/size, class scores, then (x, y, conf) per keypoint. Optional
+    leading batch dimension of 1 is accepted. Coordinates are returned in
+    the network input space.
+
+    Args:
+        output: Raw model output for a single image
+        conf_threshold: Minimum class score to keep
+        iou_threshold: NMS IoU threshold
+        num_keypoints: Keypoints per detection
+
+    Returns:
+        Detections in network input coordinates
+    """
+    preds = output.reshape(output.shape[-2], output.shape[-1]).T  # (anchors, channels)
+    num_classes = preds.shape[1] - 4 - num_keypoints * 3
+
+    scores = preds[:, 4:4 + num_classes].max(axis=1)
+    candidates = scores >= conf_threshold
+    preds, scores = preds[candidates], scores[candidates]
+    if len(preds) == 0:
+        return Detections.empty(num_keypoints)
+
+    xywh = preds[:, :4].copy()
+    xywh[:, :2] -= xywh[:, 2:] / 2  # center -> top-left for NMSBoxes
+    keep = np.asarray(
+        cv2.dnn.NMSBoxes(xywh.tolist(), scores.tolist(), conf_threshold, iou_threshold),
+        dtype=np.int64,
+    ).reshape(-1)
+
+    bboxes = xywh[keep]
+    bboxes[:, 2:] += bboxes[:, :2]  # top-left + size -> x2, y2
+    kps = preds[keep, 4 + num_classes:].reshape(-1, num_keypoints, 3)
+    return Detections(
+        bboxes=bboxes.astype(np.float32),
+        kps_xy=kps[..., :2].astype(np.float32),
+        kps_conf=kps[..., 2].astype(np.float32),
+        det_conf=scores[keep].astype(np.float32),
+    )
+
+
+class TextPatchCache:
+    """
+    Cache of pre-rendered text patches for overlays drawn every frame.
+
+    Each distinct text is rasterized once with cv2.putText onto a small
+    patch; later draws only copy the glyph pixels into the frame through
+    a mask. Only worthwhile for texts that repeat across frames (e.g. an
+    FPS counter refreshed every few frames), not for live readings.
+
+    Args:
+        font_scale (float): cv2.putText font scale
+        color (tuple): BGR text color
+        thickness (int): Text stroke thickness
+        line_type (int): cv2 line type (e.g. cv2.LINE_AA)
+        max_entries (int): Cache size; the cache is reset when full
+    """
+
+    def __init__(self, font_scale: float, color: tuple, thickness: int = 1,
+                 line_type: int = cv2.LINE_8, max_entries: int = 256):
+        self.font_scale = font_scale
+        self.color = color
+        self.thickness = thickness
+        self.line_type = line_type
+        self.max_entries = max_entries
+        self._cache = {}
+
+    def _render(self, text: str) -> tuple:
+        """Rasterize `text` into (patch, mask, origin_x, origin_y)."""
+        (w, h), baseline = cv2.getTextSize(
+            text, cv2.FONT_HERSHEY_SIMPLEX, self.font_scale, self.thickness
+        )
+        # Strokes extend up to `thickness` px beyond the nominal text box
+        margin = self.thickness
+        org_x = margin
+        org_y = h + margin
+        shape = (org_y + baseline + margin + 1, w + 2 * org_x + 1)
+
+        patch = np.zeros((*shape, 3), dtype=np.uint8)
+        cv2.putText(patch, text, (org_x, org_y), cv2.FONT_HERSHEY_SIMPLEX,
+                    self.font_scale, self.color, self.thickness, self.line_type)
+
+        mask = np.zeros(shape, dtype=np.uint8)
+        cv2.putText(mask, text, (org_x, org_y), cv2.FONT_HERSHEY_SIMPLEX,
+                    self.font_scale, 255, self.thickness, self.line_type)
+
+        return patch, mask.astype(bool), org_x, org_y
+
+    def draw(self, frame: np.ndarray, text: str, org: tuple):
+        """
+        Draw `text` on `frame` in place, with `org` being the bottom-left
+        text origin as in cv2.putText. Clipped at the frame borders.
+        """
+        entry = self._cache.get(text)
+        if entry is None:
+            if len(self._cache) >= self.max_entries:
+                self._cache.clear()
+            entry = self._cache[text] = self._render(text)
+        patch, mask, org_x, org_y = entry
+
+        x, y = int(org[0]) - org_x, int(org[1]) - org_y
+        ph, pw = patch.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + pw, frame.shape[1]), min(y + ph, frame.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        np.copyto(
+            frame[y0:y1, x0:x1], patch[y0 - y:y1 - y, x0 - x:x1 - x],
+            where=mask[y0 - y:y1 - y, x0 - x:x1 - x, None],
+        )
+
+
 class GaugeReader:
     """
     Reads analog gauge meter values using a YOLOv8 Pose model.
@@ -37,10 +307,55 @@ class GaugeReader:
             - max_angle (float): Angle in degrees at max_value position
             - unit (str): Unit of measurement (e.g., "kg/cm²")
         confidence (float): Detection confidence threshold
+        engine (str): TensorRT precision to run with ("fp16" or "int8").
+            When set and model_path is a .pt file, the model is exported
+            to a TensorRT engine once and the cached engine is loaded.
+            Empty/None keeps the PyTorch model.
+        calib_data (str): Dataset YAML with representative gauge frames,
+            required for INT8 calibration
+        engine_batch (int): Maximum batch size of the TensorRT engine.
+            Values > 1 build a dynamic-batch engine (needed for multi-stream
+            batching) and set the INT8 calibration batch size
+        imgsz (int): Inference input size. Frames larger than imgsz are
+            downscaled (aspect ratio kept) before inference and detections
+            are scaled back to the original frame resolution
+        backend (str): Inference backend:
+            - "ultralytics": Ultralytics YOLO (PyTorch or TensorRT engine)
+            - "dnn": OpenCV DNN on CPU (OpenVINO when OpenCV is built with
+              it); a .pt model is exported to ONNX once
+            - "auto": "dnn" for .onnx models, otherwise "ultralytics"
+            - "none": load no model; only the angle/value mapping
+              (read_detections, draw_result) is available, for pipelines
+              that run inference elsewhere (e.g. DeepStream nvinfer)
     """
 
-    def __init__(self, model_path: str, gauge_config: dict, confidence: float = 0.5):
-        self.model = YOLO(model_path)
+    def __init__(self, model_path: str, gauge_config: dict, confidence: float = 0.5,
+                 engine: str | None = None, calib_data: str | None = None,
+                 engine_batch: int = 1, imgsz: int = 640, backend: str = "auto"):
+        self.imgsz = imgsz
+        if backend == "auto":
+            backend = "dnn" if model_path.endswith(".onnx") else "ultralytics"
+        if backend not in ("ultralytics", "dnn", "none"):
+            raise ValueError(f"Unsupported inference backend: {backend}")
+        self.backend = backend
+
+        self.model = None
+        self.net = None
+        self._predictor_cls = None
+        if backend == "dnn":
+            if model_path.endswith(".pt"):
+                model_path = self.export_onnx(model_path, imgsz=imgsz)
+            self.net = self._load_dnn(model_path)
+        elif backend == "ultralytics":
+            if engine and model_path.endswith(".pt"):
+                model_path = self.export_engine(
+                    model_path, engine, calib_data, batch=engine_batch, imgsz=imgsz
+                )
+            # Imported here: the "dnn" and "none" backends run without torch
+            from ultralytics import YOLO
+
+            self.model = YOLO(model_path, task="pose")
+            self._predictor_cls = _gauge_pose_predictor_cls()
         self.gauge_config = gauge_config
         self.confidence = confidence
 
@@ -51,14 +366,186 @@ class GaugeReader:
         self.max_angle = gauge_config.get("max_angle", -45)
         self.unit = gauge_config.get("unit", "kg/cm2")
 
+        # Precompute the loop-invariant calibration terms used per detection.
+        # All angles are normalized to [0, 360) range.
+        # For a typical gauge: min_angle=220° (0 position) sweeping CW to max_angle=333° (max position)
+        # The CW sweep passes through 0°, so sweep = (360 - min_a) + max_a
+        # But if min_a < max_a (e.g., 30° to 330°), sweep = max_a - min_a (CCW)
+        # We use the "clockwise distance from min to max" for typical gauges
+        self._min_a_norm = self.min_angle % 360
+        self._max_a_norm = self.max_angle % 360
+        # Clockwise distance from min_a to max_a (going CW = decreasing angle in math convention)
+        self._cw_sweep = (self._min_a_norm - self._max_a_norm) % 360
+        # A degenerate sweep maps every angle to min_value
+        self._inv_sweep = 0.0 if self._cw_sweep < 0.001 else 1.0 / self._cw_sweep
+        self._value_span = self.max_value - self.min_value
+
         logger.info(
             f"GaugeReader initialized: "
             f"value=[{self.min_value}, {self.max_value}] {self.unit}, "
             f"angle=[{self.min_angle}°, {self.max_angle}°], "
-            f"confidence={self.confidence}"
+            f"confidence={self.confidence}, imgsz={self.imgsz}, "
+            f"backend={self.backend}, model={model_path}"
+        )
+
+    @staticmethod
+    def export_engine(model_path: str, precision: str = "fp16",
+                      calib_data: str | None = None, batch: int = 1,
+                      workspace: float = 4, imgsz: int = 640) -> str:
+        """
+        Export a .pt model to a TensorRT engine, reusing a cached engine
+        if it is newer than the source weights.
+
+        The engine is written next to the .pt file as "<name>.engine",
+        with "-int8" appended for INT8, "-b<batch>" for dynamic-batch
+        engines and "-<imgsz>" for non-default input sizes
+        (e.g. "gauge-pose-int8-b8-480.engine").
+
+        INT8 calibration runs over the images listed in `calib_data`
+        (a YOLO dataset YAML, see config/calibration.yaml); ~200 frames
+        captured from the deployment cameras are enough.
+
+        Args:
+            model_path: Path to the YOLOv8 Pose model (.pt file)
+            precision: "fp16" or "int8"
+            calib_data: Dataset YAML used for INT8 calibration
+            batch: Maximum engine batch size (> 1 builds a dynamic-batch
+                engine); also the INT8 calibration batch size
+            workspace: TensorRT builder workspace size in GiB
+            imgsz: Network input size (TensorRT engines have a fixed size)
+
+        Returns:
+            Path to the TensorRT engine file
+        """
+        if precision not in ("fp16", "int8"):
+            raise ValueError(f"Unsupported engine precision: {precision}")
+
+        stem = os.path.splitext(model_path)[0]
+        suffix = "-int8" if precision == "int8" else ""
+        if batch > 1:
+            suffix += f"-b{batch}"
+        if imgsz != 640:
+            suffix += f"-{imgsz}"
+        engine_path = f"{stem}{suffix}.engine"
+
+        if (os.path.exists(engine_path)
+                and os.path.getmtime(engine_path) >= os.path.getmtime(model_path)):
+            logger.info(f"Using cached TensorRT engine: {engine_path}")
+            return engine_path
+
+        export_args = {
+            "format": "engine",
+            "device": 0,
+            "half": True,
+            "simplify": True,
+            "opset": 12,
+            "imgsz": imgsz,
+            "workspace": workspace,
+            "batch": batch,
+            "dynamic": batch > 1,
+        }
+        if precision == "int8":
+            if not calib_data:
+                raise ValueError("INT8 engine export requires 'calib_data' (calibration dataset YAML)")
+            # half and int8 are mutually exclusive in the Ultralytics exporter;
+            # TensorRT INT8 calibration requires a dynamic-shape engine
+            export_args.update(half=False, int8=True, data=calib_data, dynamic=True)
+
+        from ultralytics import YOLO
+
+        logger.info(f"Exporting {model_path} to TensorRT ({precision}), this may take a few minutes...")
+        exported_path = YOLO(model_path).export(**export_args)
+
+        if os.path.abspath(exported_path) != os.path.abspath(engine_path):
+            os.replace(exported_path, engine_path)
+        logger.info(f"TensorRT engine saved to: {engine_path}")
+        return engine_path
+
+    @staticmethod
+    def export_onnx(model_path: str, imgsz: int = 640, batch: int = 1,
+                    dynamic: bool = False, output_path: str | None = None) -> str:
+        """
+        Export a .pt model to ONNX (for DeepStream nvinfer / cv2.dnn),
+        reusing a cached export if it is newer than the source weights.
+
+        The default file name encodes the input size and batch
+        ("<name>-<imgsz>.onnx", "<name>-b<batch>-<imgsz>.onnx") so exports
+        for different settings never overwrite each other, nor the
+        "<name>.onnx" intermediate written by the TensorRT export.
+
+        Args:
+            model_path: Path to the YOLOv8 Pose model (.pt file)
+            imgsz: Network input size
+            batch: Batch size of the exported model
+            dynamic: Export dynamic axes (always on when batch > 1)
+            output_path: Where to write the ONNX file. Defaults to the
+                name above, next to the .pt
+
+        Returns:
+            Path to the ONNX file
+        """
+        dynamic = dynamic or batch > 1
+        stem = os.path.splitext(model_path)[0]
+        suffix = f"-b{batch}" if batch > 1 else ""
+        if dynamic and batch == 1:
+            suffix += "-dynamic"
+        onnx_path = output_path or f"{stem}{suffix}-{imgsz}.onnx"
+
+        if (os.path.exists(onnx_path)
+                and os.path.getmtime(onnx_path) >= os.path.getmtime(model_path)):
+            logger.info(f"Using cached ONNX model: {onnx_path}")
+            return onnx_path
+
+        from ultralytics import YOLO
+
+        logger.info(f"Exporting {model_path} to ONNX...")
+        exported_path = YOLO(model_path).export(
+            format="onnx", opset=12, simplify=True,
+            imgsz=imgsz, batch=batch, dynamic=dynamic,
         )
 
-    def detect_gauge(self, frame: np.ndarray) -> list[dict]:
+        if os.path.abspath(exported_path) != os.path.abspath(onnx_path):
+            os.replace(exported_path, onnx_path)
+        logger.info(f"ONNX model saved to: {onnx_path}")
+        return onnx_path
+
+    @staticmethod
+    def _load_dnn(onnx_path: str) -> cv2.dnn.Net:
+        """Load an ONNX model with OpenCV DNN, preferring the OpenVINO backend on CPU."""
+        net = cv2.dnn.readNetFromONNX(onnx_path)
+        openvino_targets = cv2.dnn.getAvailableTargets(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+        if cv2.dnn.DNN_TARGET_CPU in openvino_targets:
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_INFERENCE_ENGINE)
+            logger.info("OpenCV DNN backend: OpenVINO (CPU)")
+        else:
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            logger.info("OpenCV DNN backend: OpenCV (CPU)")
+        net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+        return net
+
+    def _detect_dnn(self, frame: np.ndarray) -> Detections:
+        """Run the OpenCV DNN model on one frame and decode the raw pose output."""
+        # Letterbox (aspect ratio kept, gray padding) as the model was trained
+        h, w = frame.shape[:2]
+        scale = self.imgsz / max(h, w)
+        new_w, new_h = round(w * scale), round(h * scale)
+        left, top = (self.imgsz - new_w) // 2, (self.imgsz - new_h) // 2
+        canvas = np.full((self.imgsz, self.imgsz, 3), 114, dtype=np.uint8)
+        canvas[top:top + new_h, left:left + new_w] = cv2.resize(
+            frame, (new_w, new_h), interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        )
+
+        blob = cv2.dnn.blobFromImage(canvas, scalefactor=1.0 / 255, swapRB=True)
+        self.net.setInput(blob)
+        output = self.net.forward()  # (1, 4 + num_classes + num_keypoints * 3, num_anchors)
+        detections = decode_pose_output(output[0], self.confidence)
+
+        # Undo the letterbox padding, then the resize
+        detections.bboxes -= np.array([left, top, left, top], dtype=np.float32)
+        detections.kps_xy -= np.array([left, top], dtype=np.float32)
+        return detections.scaled(1 / scale, 1 / scale)
+
+    def detect_gauge(self, frame: np.ndarray) -> Detections:
         """
         Run YOLOv8 Pose inference on a frame to detect gauges and keypoints.
 
@@ -66,32 +553,62 @@ class GaugeReader:
             frame: BGR image (numpy array)
 
         Returns:
-            List of detection dicts, each containing:
-              - bbox: [x1, y1, x2, y2]
-              - keypoints: list of (x, y, conf) tuples
-              - det_conf: detection confidence
+            Detections of the frame (bboxes, keypoint xy/conf, detection conf)
+        """
+        return self.detect_gauge_batch([frame])[0]
+
+    def detect_gauge_batch(self, frames: list[np.ndarray]) -> list[Detections]:
         """
-        results = self.model(frame, conf=self.confidence, verbose=False)
-        detections = []
+        Run YOLOv8 Pose inference on several frames in a single forward pass.
+
+        Frames are downscaled (INTER_AREA, aspect ratio kept) so their
+        longer side is imgsz, which the Ultralytics letterbox then pads to
+        the network input as in training; boxes and keypoints are scaled
+        back to each frame's original resolution.
+
+        Args:
+            frames: List of BGR images (numpy arrays)
+
+        Returns:
+            One Detections object per input frame, in input order
+        """
+        if self.net is not None:
+            # The exported ONNX model has a static batch of 1
+            return [self._detect_dnn(frame) for frame in frames]
+
+        small_frames = []
+        for frame in frames:
+            h, w = frame.shape[:2]
+            scale = self.imgsz / max(h, w)
+            if scale < 1:
+                frame = cv2.resize(
+                    frame, (round(w * scale), round(h * scale)), interpolation=cv2.INTER_AREA
+                )
+            small_frames.append(frame)
+
+        results = self.model.predict(
+            small_frames, conf=self.confidence, imgsz=self.imgsz, verbose=False,
+            batch=len(frames), predictor=self._predictor_cls,
+        )
+        batch_detections = []
 
-        for result in results:
+        for frame, small, result in zip(frames, small_frames, results):
             if result.keypoints is None or result.boxes is None:
+                batch_detections.append(Detections.empty())
                 continue
 
-            boxes = result.boxes.xyxy.cpu().numpy()
-            confs = result.boxes.conf.cpu().numpy()
-            keypoints_data = result.keypoints.data.cpu().numpy()
-
-            for i in range(len(boxes)):
-                kps = keypoints_data[i]  # Shape: (num_keypoints, 3) -> x, y, conf
-                det = {
-                    "bbox": boxes[i].tolist(),
-                    "keypoints": [(float(kp[0]), float(kp[1]), float(kp[2])) for kp in kps],
-                    "det_conf": float(confs[i]),
-                }
-                detections.append(det)
+            keypoints_data = result.keypoints.data.cpu().numpy()  # (N, K, 3) -> x, y, conf
+            detections = Detections(
+                bboxes=result.boxes.xyxy.cpu().numpy(),
+                kps_xy=keypoints_data[..., :2],
+                kps_conf=keypoints_data[..., 2],
+                det_conf=result.boxes.conf.cpu().numpy(),
+            )
+            batch_detections.append(detections.scaled(
+                frame.shape[1] / small.shape[1], frame.shape[0] / small.shape[0]
+            ))
 
-        return detections
+        return batch_detections
 
     @staticmethod
     def compute_angle(center: tuple, needle_tip: tuple) -> float:
@@ -114,11 +631,10 @@ class GaugeReader:
         Returns:
             Angle in degrees [-180, 180]
         """
-        dx = needle_tip[0] - center[0]
-        dy = -(needle_tip[1] - center[1])  # Negate because y is inverted in image coords
-
-        angle = math.degrees(math.atan2(dy, dx))
-        return angle
+        return _compute_angle(
+            float(center[0]), float(center[1]),
+            float(needle_tip[0]), float(needle_tip[1]),
+        )
 
     def angle_to_value(self, angle: float) -> float:
         """
@@ -136,36 +652,10 @@ class GaugeReader:
         Returns:
             Gauge reading value
         """
-        # Normalize all angles to [0, 360) range
-        def normalize(a):
-            return a % 360
-
-        min_a = normalize(self.min_angle)
-        max_a = normalize(self.max_angle)
-        needle_a = normalize(angle)
-
-        # Calculate the clockwise sweep from min to max
-        # For a typical gauge: min_angle=220° (0 position) sweeping CW to max_angle=333° (max position)
-        # The CW sweep passes through 0°, so sweep = (360 - min_a) + max_a
-        # But if min_a < max_a (e.g., 30° to 330°), sweep = max_a - min_a (CCW)
-        # We use the "clockwise distance from min to max" for typical gauges
-
-        # Clockwise distance from min_a to max_a (going CW = decreasing angle in math convention)
-        cw_sweep = (min_a - max_a) % 360
-
-        # Clockwise distance from min_a to needle
-        cw_needle = (min_a - needle_a) % 360
-
-        # Fraction of sweep
-        if cw_sweep < 0.001:
-            return self.min_value
-
-        fraction = cw_needle / cw_sweep
-        fraction = max(0.0, min(1.0, fraction))
-
-        # Linear interpolation
-        value = self.min_value + fraction * (self.max_value - self.min_value)
-        return value
+        return _angle_to_value(
+            float(angle), float(self._min_a_norm), float(self._inv_sweep),
+            float(self.min_value), float(self._value_span),
+        )
 
     def read_gauge(self, frame: np.ndarray) -> list[dict]:
         """
@@ -184,66 +674,104 @@ class GaugeReader:
               - needle_tip (tuple): (x, y) of needle tip
               - confidence (float): Detection confidence
         """
-        detections = self.detect_gauge(frame)
-        readings = []
+        return self.read_gauge_batch([frame])[0]
 
-        for det in detections:
-            kps = det["keypoints"]
+    def read_gauge_batch(self, frames: list[np.ndarray]) -> list[list[dict]]:
+        """
+        Batched pipeline: run one forward pass over all frames, then
+        compute the readings for each frame.
 
-            if len(kps) < 2:
-                logger.warning("Detection has fewer than 2 keypoints, skipping")
-                continue
+        Args:
+            frames: List of BGR images (numpy arrays)
 
-            # Keypoint 0: Center, Keypoint 1: Needle tip
-            center = (kps[0][0], kps[0][1])
-            needle_tip = (kps[1][0], kps[1][1])
-            kp_center_conf = kps[0][2]
-            kp_needle_conf = kps[1][2]
-
-            # Skip if keypoint confidence is too low
-            if kp_center_conf < 0.3 or kp_needle_conf < 0.3:
-                logger.warning(
-                    f"Low keypoint confidence: center={kp_center_conf:.2f}, "
-                    f"needle={kp_needle_conf:.2f}, skipping"
-                )
-                continue
+        Returns:
+            One list of reading dicts per input frame, in input order
+            (see read_gauge for the dict layout)
+        """
+        return [
+            self.read_detections(detections)
+            for detections in self.detect_gauge_batch(frames)
+        ]
 
-            # Compute angle and value
-            angle = self.compute_angle(center, needle_tip)
-            value = self.angle_to_value(angle)
+    def read_detections(self, detections: Detections) -> list[dict]:
+        """
+        Compute angle and value for all detections of a single frame at once.
 
-            readings.append({
-                "value": round(value, 3),
-                "angle": round(angle, 2),
-                "unit": self.unit,
-                "bbox": det["bbox"],
-                "center": center,
-                "needle_tip": needle_tip,
-                "confidence": det["det_conf"],
-                "kp_center_conf": kp_center_conf,
-                "kp_needle_conf": kp_needle_conf,
-            })
+        Used by read_gauge, and directly by pipelines that run inference
+        outside Ultralytics (e.g. DeepStream nvinfer).
 
-        return readings
+        Args:
+            detections: Detections of one frame, in frame coordinates
+
+        Returns:
+            List of reading dicts (see read_gauge for the layout)
+        """
+        if len(detections) == 0:
+            return []
+
+        if detections.kps_xy.shape[1] < 2:
+            logger.warning("Detections have fewer than 2 keypoints, skipping")
+            return []
+
+        # Keypoint 0: Center, Keypoint 1: Needle tip
+        centers = detections.kps_xy[:, 0]
+        tips = detections.kps_xy[:, 1]
+        center_confs = detections.kps_conf[:, 0]
+        needle_confs = detections.kps_conf[:, 1]
+
+        # Confidence check, angle and value for every detection in one compiled call
+        values, angles, keep = _process_detections(
+            np.ascontiguousarray(detections.kps_xy[:, :2]),
+            np.ascontiguousarray(detections.kps_conf[:, :2]),
+            0.3,
+            float(self._min_a_norm), float(self._inv_sweep),
+            float(self.min_value), float(self._value_span),
+        )
+
+        # Skip detections whose keypoint confidence is too low
+        for i in np.flatnonzero(~keep):
+            logger.warning(
+                f"Low keypoint confidence: center={center_confs[i]:.2f}, "
+                f"needle={needle_confs[i]:.2f}, skipping"
+            )
+
+        # Convert to plain Python types only at the output boundary, kept rows only
+        return [
+            {
+                "value": round(float(values[i]), 3),
+                "angle": round(float(angles[i]), 2),
+                "unit": self.unit,
+                "bbox": detections.bboxes[i].tolist(),
+                "center": tuple(centers[i].tolist()),
+                "needle_tip": tuple(tips[i].tolist()),
+                "confidence": float(detections.det_conf[i]),
+                "kp_center_conf": float(center_confs[i]),
+                "kp_needle_conf": float(needle_confs[i]),
+            }
+            for i in np.flatnonzero(keep)
+        ]
 
     def draw_result(self, frame: np.ndarray, readings: list[dict],
                     show_keypoints: bool = True,
                     show_angle: bool = True,
-                    show_bbox: bool = True) -> np.ndarray:
+                    show_bbox: bool = True,
+                    inplace: bool = False) -> np.ndarray:
         """
         Annotate a frame with gauge reading results.
 
         Args:
-            frame: BGR image to draw on (will be copied)
+            frame: BGR image to draw on (copied unless inplace=True)
             readings: List of reading dicts from read_gauge()
             show_keypoints: Draw center and needle tip points
             show_angle: Display angle information
             show_bbox: Draw bounding box
+            inplace: Draw directly on `frame` instead of a copy. Use when
+                the raw frame is not needed afterwards (e.g. realtime display)
 
         Returns:
-            Annotated frame (copy)
+            Annotated frame (`frame` itself if inplace, otherwise a copy)
         """
-        annotated = frame.copy()
+        annotated = frame if inplace else frame.copy()
 
         for reading in readings:
             bbox = reading["bbox"]
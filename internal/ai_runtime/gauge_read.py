@@ -1,7 +1,8 @@
 """
 Bridge module for importing from 'gauge-pose' directory.
 The directory name contains a hyphen which is not valid
-for direct Python imports. This module re-exports GaugeReader.
+for direct Python imports. This module re-exports GaugeReader, Detections, TextPatchCache
+and decode_pose_output.
 """
 
 import importlib
@@ -16,6 +17,6 @@ _gauge_pose_dir = os.path.join(
 if _gauge_pose_dir not in sys.path:
     sys.path.insert(0, _gauge_pose_dir)
 
-from gauge_read import GaugeReader
+from gauge_read import Detections, GaugeReader, TextPatchCache, decode_pose_output
 
-__all__ = ["GaugeReader"]
+__all__ = ["Detections", "GaugeReader", "TextPatchCache", "decode_pose_output"]
@@ -0,0 +1,130 @@
+"""
+Test Script for TensorRT Engine Accuracy
+==========================================
+Compares keypoints predicted by the TensorRT engine (model.engine in the
+config, FP16 when unset) against the original PyTorch model on the test
+images and validates that quantization moves the keypoints by less than
+1 pixel.
+
+Usage:
+  cd /home/ozzaann/gauge_model
+  source gauge_meter_analog_reading_realtime/.gauge_meter/bin/activate
+  python -m gauge_meter_analog_reading_realtime.test.test_engine_accuracy
+"""
+
+import sys
+import os
+import cv2
+import logging
+import numpy as np
+
+# Ensure the project root is importable
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from gauge_meter_analog_reading_realtime.app.main import load_config
+from gauge_meter_analog_reading_realtime.internal.ai_runtime.gauge_read import GaugeReader
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger("EngineAccuracyTest")
+
+# === Test Parameters ===
+MAX_KEYPOINT_ERROR_PX = 1.0  # Max allowed keypoint shift vs PyTorch
+CONFIG_PATH = "gauge_meter_analog_reading_realtime/config/gauge_config.yaml"
+TEST_IMAGE_PATHS = [
+    "gauge_meter_analog_reading_realtime/data_test/test_image.png",
+    "gauge_meter_analog_reading_realtime/data_test/test_image2.png",
+    "gauge_meter_analog_reading_realtime/data_test/test_image3.png",
+]
+
+
+def run_test():
+    logger.info("=" * 60)
+    logger.info("  TENSORRT ENGINE ACCURACY TEST")
+    logger.info("=" * 60)
+
+    # Load config
+    config = load_config(CONFIG_PATH)
+
+    model_cfg = config.get("model", {})
+    gauge_cfg = config.get("gauge", {})
+    precision = model_cfg.get("engine") or "fp16"
+    calib_data = model_cfg.get("calib_data") or None
+
+    if precision == "int8" and not calib_data:
+        logger.error("    ❌ FAIL: engine 'int8' requires model.calib_data (see config/calibration.yaml)")
+        logger.info("=" * 60)
+        logger.info("  TEST RESULT: ❌ SOME TESTS FAILED")
+        logger.info("=" * 60)
+        return False
+
+    # Reference PyTorch model and TensorRT engine under test
+    reference = GaugeReader(
+        model_path=model_cfg.get("path"),
+        gauge_config=gauge_cfg,
+        confidence=model_cfg.get("confidence", 0.5),
+        imgsz=model_cfg.get("imgsz", 640),
+    )
+    engine = GaugeReader(
+        model_path=model_cfg.get("path"),
+        gauge_config=gauge_cfg,
+        confidence=model_cfg.get("confidence", 0.5),
+        engine=precision,
+        calib_data=calib_data,
+        engine_batch=model_cfg.get("engine_batch", 1),
+        imgsz=model_cfg.get("imgsz", 640),
+    )
+
+    all_passed = True
+    for image_path in TEST_IMAGE_PATHS:
+        frame = cv2.imread(image_path)
+        if frame is None:
+            logger.error(f"FAIL: Cannot read test image: {image_path}")
+            all_passed = False
+            continue
+
+        ref_dets = reference.detect_gauge(frame)
+        eng_dets = engine.detect_gauge(frame)
+
+        if len(ref_dets) == 0:
+            logger.warning(f"  {image_path}: no gauge detected by PyTorch model, skipping")
+            continue
+        if len(eng_dets) == 0:
+            logger.error(f"    ❌ FAIL: {image_path}: no gauge detected by {precision} engine")
+            all_passed = False
+            continue
+
+        # Compare the most confident detection of each model
+        ref_kps = ref_dets.kps_xy[np.argmax(ref_dets.det_conf)]
+        eng_kps = eng_dets.kps_xy[np.argmax(eng_dets.det_conf)]
+        errors = np.linalg.norm(ref_kps - eng_kps, axis=1)
+
+        logger.info(f"\n  {image_path}:")
+        logger.info(f"    Center error    : {errors[0]:.2f} px")
+        logger.info(f"    Needle tip error: {errors[1]:.2f} px")
+
+        if errors.max() < MAX_KEYPOINT_ERROR_PX:
+            logger.info(f"    ✅ PASS: Keypoint error within {MAX_KEYPOINT_ERROR_PX} px")
+        else:
+            logger.error(f"    ❌ FAIL: Keypoint error {errors.max():.2f} px exceeds {MAX_KEYPOINT_ERROR_PX} px")
+            all_passed = False
+
+    logger.info("=" * 60)
+    if all_passed:
+        logger.info("  TEST RESULT: ✅ ALL PASSED")
+    else:
+        logger.info("  TEST RESULT: ❌ SOME TESTS FAILED")
+        logger.info("  Hint: Keep the pose head in FP16 (see README, Kalibrasi INT8)")
+    logger.info("=" * 60)
+
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_test()
+    sys.exit(0 if success else 1)
@@ -13,7 +13,6 @@ Usage:
 import sys
 import os
 import cv2
-import yaml
 import logging
 
 # Ensure the project root is importable
@@ -21,6 +20,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from gauge_meter_analog_reading_realtime.app.main import load_config
 from gauge_meter_analog_reading_realtime.internal.ai_runtime.gauge_read import GaugeReader
 
 logging.basicConfig(
@@ -43,8 +43,7 @@ def run_test():
     logger.info("=" * 60)
 
     # Load config
-    with open(CONFIG_PATH, "r") as f:
-        config = yaml.safe_load(f)
+    config = load_config(CONFIG_PATH)
 
     model_cfg = config.get("model", {})
     gauge_cfg = config.get("gauge", {})
@@ -54,6 +53,8 @@ def run_test():
         model_path=model_cfg.get("path"),
         gauge_config=gauge_cfg,
         confidence=model_cfg.get("confidence", 0.5),
+        imgsz=model_cfg.get("imgsz", 640),
+        backend=model_cfg.get("backend", "auto"),
     )
 
     # Read test image
@@ -75,10 +76,10 @@ def run_test():
         logger.info("Running raw detection for diagnostics...")
         detections = reader.detect_gauge(frame)
         logger.info(f"Raw detections found: {len(detections)}")
-        for i, det in enumerate(detections):
-            logger.info(f"  Detection #{i}: bbox={det['bbox']}, conf={det['det_conf']:.3f}")
-            for j, kp in enumerate(det['keypoints']):
-                logger.info(f"    Keypoint {j}: x={kp[0]:.1f}, y={kp[1]:.1f}, conf={kp[2]:.3f}")
+        for i in range(len(detections)):
+            logger.info(f"  Detection #{i}: bbox={detections.bboxes[i].tolist()}, conf={detections.det_conf[i]:.3f}")
+            for j, (kp, kp_conf) in enumerate(zip(detections.kps_xy[i], detections.kps_conf[i])):
+                logger.info(f"    Keypoint {j}: x={kp[0]:.1f}, y={kp[1]:.1f}, conf={kp_conf:.3f}")
         return False
 
     # Report results